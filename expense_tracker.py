@@ -1,7 +1,13 @@
+import bisect
 import calendar
+import csv
 import datetime
+import io
 import os
-from typing import List, Dict, Optional # Note: 'typing' is used for clear documentation (type hints) but the logic does not rely on advanced types.
+import re
+import sys
+from array import array
+from typing import List, Dict, Optional, Set, Tuple # Note: 'typing' is used for clear documentation (type hints) but the logic does not rely on advanced types.
 
 # --- Constants for Categorization and Budgeting ---
 # The 5 primary categories for tracking spending.
@@ -16,6 +22,19 @@ CORE_CATEGORIES = [
 SAVINGS_CATEGORY = "💰 Savings" 
 # Category for money taken out of savings (to keep a record).
 SAVINGS_USE_CATEGORY = "❌ Savings_Use" 
+# Every known category gets a small integer code, so totals can be kept in a plain list.
+CATEGORY_INDEX = {category: i for i, category in enumerate([*CORE_CATEGORIES, SAVINGS_CATEGORY, SAVINGS_USE_CATEGORY])}
+
+# --- Constants for the Expense File ---
+# A line "__DEL__,<row id>" marks an earlier expense row as deleted (a "tombstone").
+DELETED_MARKER = "__DEL__"
+# Stored timestamps must be exactly "YYYY-MM-DD HH:MM:SS": summaries compare them as text.
+# The pattern checks the shape and field ranges; days past the 28th are checked against the calendar separately.
+TIMESTAMP_PATTERN = re.compile(r"\d{4}-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01]) ([01]\d|2[0-3]):[0-5]\d:[0-5]\d")
+# Template for one expense row: name, amount (2 decimals), category, timestamp.
+EXPENSE_LINE_FORMAT = "%s,%.2f,%s,%s\n"
+# The file is rewritten without deleted rows once more than this share of its rows are deleted.
+COMPACTION_RATIO = 0.25
 
 # 1. Define the Expense Class (A simple way to represent structured data)
 class Expense:
@@ -27,10 +46,84 @@ class Expense:
         # Sets the current date/time if not provided
         self.timestamp = timestamp if timestamp else datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
+    @classmethod
+    def _from_parts(cls, name: str, amount: float, category: str, timestamp: str) -> "Expense":
+        """Builds an Expense from already-loaded fields, skipping the timestamp default in __init__."""
+        expense = object.__new__(cls)
+        expense.name = name
+        expense.category = category
+        expense.amount = amount
+        expense.timestamp = timestamp
+        return expense
+
     def __repr__(self):
         """String representation of the Expense object for debugging/display."""
         return f"<Expense: {self.name}, {self.amount:.2f}, {self.category}, {self.timestamp}>"
 
+# 2. Define the ExpenseTable Class (all expenses stored column by column)
+class ExpenseTable:
+    """Holds every expense as parallel columns instead of one Expense object per row."""
+    def __init__(self):
+        # Row ids are the (0-based) line number of each expense in the file, so they stay the
+        # same when other lines are fixed by hand, and tombstones keep pointing at the right row
+        self.row_ids = array("q")
+        # Number of lines in the file (the line number the next appended row will get)
+        self.line_count = 0
+        # Number of tombstone lines in the file
+        self.tombstone_count = 0
+        # Number of lines that could not be loaded (malformed); these must never be compacted away
+        self.skipped_count = 0
+        self.names: List[str] = []
+        self.amounts = array("d") # Packed float64 values, no Python object per amount
+        self.categories: List[str] = []
+        self.category_codes = array("b") # CATEGORY_INDEX code of each category, -1 if unknown
+        self.timestamps: List[str] = []
+        # Expenses are normally appended as they happen, so timestamps stay in time order;
+        # this turns False as soon as a row is added out of order
+        self.in_time_order = True
+
+    def __len__(self):
+        return len(self.amounts)
+
+    def append(self, name: str, amount: float, category: str, timestamp: str, row_id: int):
+        """Adds one expense (found on line row_id of the file) to the end of every column."""
+        self.row_ids.append(row_id)
+        self.names.append(name)
+        self.amounts.append(amount)
+        self.categories.append(category)
+        self.category_codes.append(CATEGORY_INDEX.get(category, -1))
+        if self.timestamps and timestamp < self.timestamps[-1]:
+            self.in_time_order = False
+        self.timestamps.append(timestamp)
+
+    def delete(self, index: int):
+        """Removes the expense at the given position from every column."""
+        del self.row_ids[index]
+        del self.names[index]
+        del self.amounts[index]
+        del self.categories[index]
+        del self.category_codes[index]
+        del self.timestamps[index]
+
+    def drop_row_ids(self, deleted_ids: Set[int]):
+        """Removes every expense whose row id is in deleted_ids (used after reading tombstones)."""
+        keep = [i for i, row_id in enumerate(self.row_ids) if row_id not in deleted_ids]
+        self.row_ids = array("q", [self.row_ids[i] for i in keep])
+        self.names = [self.names[i] for i in keep]
+        self.amounts = array("d", [self.amounts[i] for i in keep])
+        self.categories = [self.categories[i] for i in keep]
+        self.category_codes = array("b", [self.category_codes[i] for i in keep])
+        self.timestamps = [self.timestamps[i] for i in keep]
+
+    def to_expenses(self) -> List[Expense]:
+        """Converts the columns back into Expense objects (for code that needs them)."""
+        # Every loaded row already has a timestamp, so the __init__ default is skipped
+        from_parts = Expense._from_parts
+        return [
+            from_parts(name, amount, category, timestamp)
+            for name, amount, category, timestamp in zip(self.names, self.amounts, self.categories, self.timestamps)
+        ]
+
 # --- CORE FUNCTIONS ---
 
 def get_user_expense(categories: List[str]) -> Expense:
@@ -40,9 +133,13 @@ def get_user_expense(categories: List[str]) -> Expense:
     # Ensures name is not empty (while loop for validation)
     while True:
         expense_name = input("Enter expense name: ")
-        if expense_name.strip():
+        if expense_name.strip() == DELETED_MARKER:
+            # Reserved for delete markers in the expense file
+            print(f"'{DELETED_MARKER}' cannot be used as an expense name. Try again!")
+        elif expense_name.strip():
             break
-        print("Expense name cannot be empty. Try again!")
+        else:
+            print("Expense name cannot be empty. Try again!")
 
     # Ensures amount is positive and valid (try/except for error handling)
     while True:
@@ -55,15 +152,17 @@ def get_user_expense(categories: List[str]) -> Expense:
             print("Please enter a valid number.")
     
     # User selects category using a numbered list (for loop and conditional checks)
+    # The menu text and prompt are built once, then reused on every retry
+    num_categories = len(categories)
+    category_menu = "\nSelect a category: \n" + "\n".join(
+        f"  {i + 1}. {category_name}" for i, category_name in enumerate(categories)
+    )
+    category_prompt = f"Enter a category number [1 - {num_categories}]: "
     while True:
-        print("\nSelect a category: ")
-        for i, category_name in enumerate(categories):
-            print(f"  {i + 1}. {category_name}")
-
-        value_range = f"[1 - {len(categories)}]"
+        print(category_menu)
         try:
-            selected_index = int(input(f"Enter a category number {value_range}: ")) - 1
-            if selected_index in range(len(categories)):
+            selected_index = int(input(category_prompt)) - 1
+            if 0 <= selected_index < num_categories:
                 selected_category = categories[selected_index]
                 break
             else:
@@ -76,74 +175,269 @@ def get_user_expense(categories: List[str]) -> Expense:
     )
     return new_expense
 
-def load_expenses(expense_file_path: str) -> List[Expense]:
-    """Reads all expenses from the CSV file and converts them to Expense objects."""
-    expenses: List[Expense] = []
+# In-memory copy of the last expense file that was read: (file path, file signature, table).
+# Repeated summaries and deletes reuse it instead of re-parsing the whole CSV.
+_expense_cache: Optional[Tuple[str, Tuple[int, int, bytes], ExpenseTable]] = None
+# How many bytes from the end of the file are remembered, to tell an append apart from a rewrite
+_TAIL_CHECK_BYTES = 64
+
+def _file_signature(expense_file_path: str) -> Optional[Tuple[int, int, bytes]]:
+    """Returns (modification time, size, last few bytes) of the file, or None if it cannot be read."""
+    try:
+        with open(expense_file_path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            f.seek(max(0, stat.st_size - _TAIL_CHECK_BYTES))
+            return (stat.st_mtime_ns, stat.st_size, f.read(_TAIL_CHECK_BYTES))
+    except OSError:
+        return None
+
+def _cached_table(expense_file_path: str, signature: Optional[Tuple[int, int, bytes]]) -> Optional[ExpenseTable]:
+    """Returns the cached table if it still matches the file on disk."""
+    if _expense_cache is None or signature is None:
+        return None
+    cached_path, cached_signature, cached_table = _expense_cache
+    if cached_path == expense_file_path and cached_signature == signature:
+        return cached_table
+    return None
+
+def _remember_table(expense_file_path: str, table: Optional[ExpenseTable]):
+    """Stores the table as the current contents of the file (None clears the cache)."""
+    global _expense_cache
+    signature = _file_signature(expense_file_path)
+    if table is None or signature is None:
+        _expense_cache = None
+    else:
+        _expense_cache = (expense_file_path, signature, table)
+
+def _is_real_date(timestamp: str) -> bool:
+    """Checks that the date part of a well-shaped timestamp exists in the calendar (e.g. not April 31)."""
+    try:
+        datetime.date(int(timestamp[0:4]), int(timestamp[5:7]), int(timestamp[8:10]))
+    except ValueError:
+        return False
+    return True
+
+def _parse_expense_lines(lines, table: ExpenseTable) -> Set[int]:
+    """Adds every expense row from the CSV lines to the table; returns the row ids marked as deleted."""
+    deleted_ids: Set[int] = set()
+    append = table.append
+    # Lines are numbered on from the part of the file already in the table
+    first_line = table.line_count
+    # Timestamp for rows written without one, created only if such a row shows up
+    default_timestamp: Optional[str] = None
+    # csv.reader tokenizes each line in C, so there is no per-line strip()/split() in Python.
+    # Rows are written without CSV quoting, so quotes are read as plain characters (QUOTE_NONE),
+    # exactly like a split(",") would; a name such as '"Dinner' must not swallow the next rows.
+    reader = csv.reader(lines, quoting=csv.QUOTE_NONE)
+    for parts in reader:
+        if not parts:
+            continue 
+
+        # Same as stripping the whole line: whitespace before the first field and after the
+        # last one (e.g. a trailing space on a hand-edited timestamp) is ignored
+        parts[0] = parts[0].lstrip()
+        parts[-1] = parts[-1].rstrip()
+        # Blank lines (only whitespace or commas) are ignored, not reported as malformed
+        if not parts[0] and not "".join(parts).strip():
+            continue
+
+        # Tombstone lines only record which earlier row was deleted: exactly "__DEL__,<digits>".
+        # Anything else (e.g. an expense that happens to be named "__DEL__") is read as an expense.
+        if len(parts) == 2 and parts[0] == DELETED_MARKER and parts[1].isascii() and parts[1].isdigit():
+            deleted_ids.add(int(parts[1]))
+            table.tombstone_count += 1
+            continue
+
+        # Basic check for structure integrity
+        if len(parts) >= 3:
+            # Rows written without a timestamp get the current date/time (same as Expense)
+            if len(parts) >= 4 and parts[3]:
+                timestamp = parts[3]
+                # Rows with malformed timestamps (or impossible dates like Feb 30) are skipped here,
+                # so summaries never see them
+                if not TIMESTAMP_PATTERN.fullmatch(timestamp) or (timestamp[8:10] > "28" and not _is_real_date(timestamp)):
+                    print(f"Warning: Skipping malformed timestamp in line: {','.join(parts)}")
+                    table.skipped_count += 1
+                    continue
+            else:
+                if default_timestamp is None:
+                    default_timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                timestamp = default_timestamp
+            
+            try:
+                amount = float(parts[1])
+            except ValueError:
+                print(f"Warning: Skipping malformed amount in line: {','.join(parts)}")
+                table.skipped_count += 1
+                continue
+            # reader.line_num is the 1-based number of the line just read (one row per line)
+            append(parts[0], amount, parts[2], timestamp, first_line + reader.line_num - 1)
+        else:
+            print(f"Warning: Skipping malformed line with too few fields: {','.join(parts)}")
+            table.skipped_count += 1
+
+    table.line_count = first_line + reader.line_num
+    return deleted_ids
+
+def _read_appended_rows(expense_file_path: str, signature: Optional[Tuple[int, int, bytes]]) -> Optional[ExpenseTable]:
+    """Extends the cached table with only the rows appended since it was read (None if that is not possible)."""
+    global _expense_cache
+    if _expense_cache is None or signature is None:
+        return None
+    cached_path, cached_signature, table = _expense_cache
+    old_size = cached_signature[1]
+    if cached_path != expense_file_path or signature[1] <= old_size:
+        return None
+    # If the old file did not end with a newline, the appended bytes may continue its last
+    # line, which the cached table already holds as a finished row: read everything again
+    if cached_signature[2] and not cached_signature[2].endswith(b"\n"):
+        return None
+
+    try:
+        with open(expense_file_path, "rb", buffering=1 << 20) as raw:
+            # If the bytes that used to end the file changed, it was rewritten rather than appended to
+            raw.seek(max(0, old_size - _TAIL_CHECK_BYTES))
+            if raw.read(old_size - raw.tell()) != cached_signature[2]:
+                return None
+            # Continue parsing from the old end of the file; row ids carry on from the cached table
+            deleted_ids = _parse_expense_lines(io.TextIOWrapper(raw, encoding="utf-8", newline=""), table)
+    except Exception:
+        # The cached table may be half-updated, so drop it and let the caller re-read everything
+        _expense_cache = None
+        return None
+
+    if deleted_ids:
+        table.drop_row_ids(deleted_ids)
+    _expense_cache = (expense_file_path, signature, table)
+    return table
+
+def load_expense_table(expense_file_path: str) -> ExpenseTable:
+    """Reads all expenses from the CSV file straight into an ExpenseTable (cached until the file changes)."""
+    global _expense_cache
+    signature = _file_signature(expense_file_path)
+    table = _cached_table(expense_file_path, signature)
+    if table is not None:
+        return table
+
+    # When rows were only appended (e.g. by another tracker window), parse just the new part
+    table = _read_appended_rows(expense_file_path, signature)
+    if table is not None:
+        return table
+
+    table = ExpenseTable()
     try:
         # File Handling (using try/except for error management)
-        with open(expense_file_path, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue 
-
-                parts = line.split(",") # String manipulation
-                
-                # Basic check for structure integrity
-                if len(parts) >= 3:
-                    expense_name = parts[0]
-                    expense_amount_str = parts[1]
-                    expense_category = parts[2]
-                    timestamp = parts[3] if len(parts) >= 4 else None
-                    
-                    try:
-                        line_expense = Expense(
-                            name=expense_name,
-                            amount=float(expense_amount_str),
-                            category=expense_category,
-                            timestamp=timestamp
-                        )
-                        expenses.append(line_expense) # Appending to a list
-                    except ValueError:
-                        print(f"Warning: Skipping malformed amount in line: {line}")
-                else:
-                    print(f"Warning: Skipping malformed line with too few fields: {line}")
+        # The file is streamed through a 1 MiB buffer instead of holding every line in a list.
+        with open(expense_file_path, "r", encoding="utf-8", newline="", buffering=1 << 20) as f:
+            deleted_ids = _parse_expense_lines(f, table)
 
     except FileNotFoundError:
         print(f"Info: Expense file '{expense_file_path}' not found. Creating a new one.")
-        pass
+        return table
     except Exception as e:
         print(f"Error loading expenses: {e}")
-        
-    return expenses
+        return table
+
+    if deleted_ids:
+        table.drop_row_ids(deleted_ids)
+
+    if signature is not None:
+        _expense_cache = (expense_file_path, signature, table)
+    return table
+
+def load_expenses(expense_file_path: str) -> List[Expense]:
+    """Reads all expenses from the CSV file and converts them to Expense objects."""
+    return load_expense_table(expense_file_path).to_expenses()
 
 def save_all_expenses(expenses: List[Expense], expense_file_path: str):
     """Writes all expenses back to the file (used for saving and deletion)."""
     try:
         # 'w' mode overwrites the entire file.
-        with open(expense_file_path, "w", encoding="utf-8") as f:
-            for expense in expenses:
-                f.write(f"{expense.name},{expense.amount:.2f},{expense.category},{expense.timestamp}\n")
+        # A 1 MiB buffer plus a single writelines() call lets the file object batch all rows together.
+        with open(expense_file_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+            f.writelines(
+                EXPENSE_LINE_FORMAT % (expense.name, expense.amount, expense.category, expense.timestamp)
+                for expense in expenses
+            )
     except Exception as e:
         print(f"Error saving all expenses: {e}")
+        _remember_table(expense_file_path, None)
+        return
+
+    # The file now holds exactly these expenses, so cache them without re-reading it
+    table = ExpenseTable()
+    for line_number, expense in enumerate(expenses):
+        table.append(expense.name, round(expense.amount, 2), expense.category, expense.timestamp, line_number)
+    table.line_count = len(expenses)
+    _remember_table(expense_file_path, table)
+
+def _line_start(signature: Optional[Tuple[int, int, bytes]]) -> str:
+    """Returns the newline needed before appending a row, if the file (e.g. after a hand edit) doesn't end with one."""
+    if signature is not None and signature[2] and not signature[2].endswith(b"\n"):
+        return "\n"
+    return ""
 
 def save_new_expense(expense: Expense, expense_file_path: str):
     """Appends a single new expense to the file."""
     print(f"🎯 Saving User Expense: {expense.name} to {expense_file_path}")
     
+    # Only a cache that matched the file before this append can be extended in place
+    signature = _file_signature(expense_file_path)
+    table = _cached_table(expense_file_path, signature)
+
     # 'a' mode appends to the end of the file.
     try:
         with open(expense_file_path, "a", encoding="utf-8") as f:
-            f.write(f"{expense.name},{expense.amount:.2f},{expense.category},{expense.timestamp}\n")
+            f.write(_line_start(signature) + EXPENSE_LINE_FORMAT % (expense.name, expense.amount, expense.category, expense.timestamp))
     except Exception as e:
         print(f"Error saving expense: {e}")
+        _remember_table(expense_file_path, None)
+        return
+
+    if table is not None:
+        table.append(expense.name, round(expense.amount, 2), expense.category, expense.timestamp, table.line_count)
+        table.line_count += 1
+        _remember_table(expense_file_path, table)
 
 
+def record_deletion(table: ExpenseTable, index: int, expense_file_path: str) -> bool:
+    """Appends a tombstone for the expense at the given table position instead of rewriting the file."""
+    # Only a cache that matched the file before this append can be updated in place
+    signature = _file_signature(expense_file_path)
+    cache_is_current = _cached_table(expense_file_path, signature) is table
+
+    try:
+        with open(expense_file_path, "a", encoding="utf-8") as f:
+            f.write(f"{_line_start(signature)}{DELETED_MARKER},{table.row_ids[index]}\n")
+    except Exception as e:
+        print(f"Error deleting expense: {e}")
+        _remember_table(expense_file_path, None)
+        return False
+
+    table.delete(index) # Removes the row from every column
+    if cache_is_current:
+        table.line_count += 1
+        table.tombstone_count += 1
+        _remember_table(expense_file_path, table)
+        _maybe_compact(table, expense_file_path)
+    else:
+        # The file changed since this table was read, so it must not be used to rewrite the file
+        _remember_table(expense_file_path, None)
+    return True
+
+def _maybe_compact(table: ExpenseTable, expense_file_path: str):
+    """Rewrites the file without deleted rows once tombstones make up too much of it."""
+    # A rewrite only keeps the rows in the table, so malformed lines that were skipped
+    # while loading would be lost: leave such a file alone until it is fixed by hand
+    if table.skipped_count:
+        return
+    if table.line_count and table.tombstone_count / table.line_count > COMPACTION_RATIO:
+        save_all_expenses(table.to_expenses(), expense_file_path)
+
 def delete_expense(expense_file_path: str):
     """Allows the user to select and delete an expense by index."""
     print("\n--- Delete Expense ---")
-    all_expenses = load_expenses(expense_file_path)
+    all_expenses = load_expense_table(expense_file_path)
 
     if not all_expenses:
         print(red("No expenses found to delete."))
@@ -151,8 +445,8 @@ def delete_expense(expense_file_path: str):
 
     print("Current Expenses:")
     # Display indexed list of expenses
-    for i, exp in enumerate(all_expenses):
-        print(f"  {i + 1}. {exp.timestamp[:10]} | {exp.category:<12} | ₹{exp.amount:8.2f} | {exp.name}")
+    for i, (name, amount, category, timestamp) in enumerate(zip(all_expenses.names, all_expenses.amounts, all_expenses.categories, all_expenses.timestamps)):
+        print(f"  {i + 1}. {timestamp[:10]} | {category:<12} | ₹{amount:8.2f} | {name}")
 
     while True:
         try:
@@ -163,11 +457,9 @@ def delete_expense(expense_file_path: str):
             
             index_to_delete = int(selection) - 1
             if 0 <= index_to_delete < len(all_expenses):
-                deleted_expense = all_expenses.pop(index_to_delete) # List operation (removal)
-                print(red(f"DELETED: {deleted_expense.name}"))
-                
-                # Rewrite the entire file with the remaining expenses
-                save_all_expenses(all_expenses, expense_file_path)
+                deleted_name = all_expenses.names[index_to_delete]
+                if record_deletion(all_expenses, index_to_delete, expense_file_path):
+                    print(red(f"DELETED: {deleted_name}"))
                 return
             else:
                 print("Invalid number. Please try again.")
@@ -199,43 +491,80 @@ def record_savings_use(expense_file_path: str):
     print(yellow(f"Recorded ₹{amount_used:.2f} used from savings for '{reason}'."))
 
 
+def tally_expenses(amounts, category_codes, timestamps, period_start: Optional[str], period_end: Optional[str], month_text: Optional[str]) -> Tuple[List[float], int]:
+    """Filters and sums amounts per category code in one pass; returns (totals, number of matching rows)."""
+    # One extra slot at the end collects unknown categories (code -1), so the loop needs no check for them
+    totals = [0.0] * (len(CATEGORY_INDEX) + 1)
+    matched_count = 0
+    rows = zip(amounts, category_codes, timestamps)
+
+    # The filter type is chosen once, so each loop below only does the work its filter needs
+    if period_start is not None:
+        for amount, code, timestamp in rows:
+            if period_start <= timestamp < period_end:
+                totals[code] += amount
+                matched_count += 1
+    elif month_text is not None:
+        for amount, code, timestamp in rows:
+            if timestamp[5:7] == month_text:
+                totals[code] += amount
+                matched_count += 1
+    else:
+        for amount, code, _ in rows:
+            totals[code] += amount
+        matched_count = len(amounts)
+
+    return totals, matched_count
+
+
 def summarize_expenses(expense_file_path: str, category_budgets: Dict[str, float], filter_month: Optional[int] = None, filter_year: Optional[int] = None):
     """Reads, filters, and summarizes expenses, including budget breakdown and savings utilization."""
     print(f"\n--- Expense Summary 📊 ---")
     
-    all_expenses = load_expenses(expense_file_path)
-    filtered_expenses: List[Expense] = []
+    all_expenses = load_expense_table(expense_file_path)
     
-    # Filtering logic (using datetime for date comparisons)
-    for exp in all_expenses:
-        try:
-            expense_date = datetime.datetime.strptime(exp.timestamp, "%Y-%m-%d %H:%M:%S")
-            
-            month_match = (filter_month is None) or (expense_date.month == filter_month)
-            year_match = (filter_year is None) or (expense_date.year == filter_year)
-            
-            if month_match and year_match:
-                filtered_expenses.append(exp)
-        except:
-            # Skip expenses with malformed timestamps
-            continue 
+    # Filtering logic: timestamps are stored as fixed-width "YYYY-MM-DD HH:MM:SS" text, which sorts
+    # in time order, so a year (or year + month) filter is one range check per row: start <= timestamp < end
+    period_start: Optional[str] = None
+    period_end: Optional[str] = None
+    month_text: Optional[str] = None
+    if filter_year is not None and filter_month is not None:
+        period_start = f"{filter_year:04d}-{filter_month:02d}"
+        period_end = f"{filter_year:04d}-{filter_month + 1:02d}" # "-13" still sorts after December
+    elif filter_year is not None:
+        period_start = f"{filter_year:04d}"
+        period_end = f"{filter_year + 1:04d}"
+    elif filter_month is not None:
+        # Same month in every year: compare the month slice directly
+        month_text = f"{filter_month:02d}"
+
+    if period_start is not None and all_expenses.in_time_order:
+        # Rows are in time order, so the period is one contiguous block of rows: find its
+        # edges with a binary search and only tally that block, not the whole history
+        first = bisect.bisect_left(all_expenses.timestamps, period_start)
+        last = bisect.bisect_left(all_expenses.timestamps, period_end)
+        totals, matched_count = tally_expenses(
+            all_expenses.amounts[first:last], all_expenses.category_codes[first:last], all_expenses.timestamps[first:last],
+            None, None, None
+        )
+    else:
+        totals, matched_count = tally_expenses(
+            all_expenses.amounts, all_expenses.category_codes, all_expenses.timestamps,
+            period_start, period_end, month_text
+        )
 
     if filter_month and filter_year:
         print(f"Summary for: {calendar.month_name[filter_month]} {filter_year}")
     
-    if not filtered_expenses:
+    if not matched_count:
         print(yellow("No expenses found for this period."))
         return
 
-    # Calculate spending by category (using a dictionary)
-    spending_by_category: Dict[str, float] = {cat: 0.0 for cat in category_budgets.keys()}
-    total_savings_used = 0.0
-    
-    for expense in filtered_expenses:
-        if expense.category in spending_by_category:
-            spending_by_category[expense.category] += expense.amount
-        elif expense.category == SAVINGS_USE_CATEGORY:
-            total_savings_used += expense.amount
+    # Only the handful of categories are looked up by name, not every row
+    spending_by_category: Dict[str, float] = {
+        cat: totals[CATEGORY_INDEX[cat]] if cat in CATEGORY_INDEX else 0.0 for cat in category_budgets
+    }
+    total_savings_used = totals[CATEGORY_INDEX[SAVINGS_USE_CATEGORY]]
 
     total_budget = sum(category_budgets.values())
     total_spent = sum(spending_by_category.values())
@@ -245,24 +574,17 @@ def summarize_expenses(expense_file_path: str, category_budgets: Dict[str, float
     is_current_month = (filter_month == now.month) and (filter_year == now.year)
 
     print("\n--- Category Breakdown vs. Budget ---")
-    BAR_LENGTH = 30
     
     for category, budget_amount in category_budgets.items():
         spent_amount = spending_by_category.get(category, 0.0)
         remaining = budget_amount - spent_amount
         
-        if budget_amount > 0:
-            percentage_used = spent_amount / budget_amount
-        else:
-            percentage_used = 0 
-            
+        # A category with no budget shows 0% instead of dividing by zero
+        percentage_used = spent_amount / budget_amount if budget_amount > 0 else 0.0
         filled_length = int(BAR_LENGTH * min(percentage_used, 1.0))
         
-        # Simple character-based bar chart for visualization
-        if remaining >= 0:
-            bar = green('█' * filled_length) + '-' * (BAR_LENGTH - filled_length)
-        else:
-            bar = red('█' * BAR_LENGTH) 
+        # Simple character-based bar chart for visualization (prebuilt strings, see BAR_TABLE)
+        bar = BAR_TABLE[filled_length] if remaining >= 0 else BAR_OVER
             
         print(f"  {category:<12} | ₹{spent_amount:8.2f}/₹{budget_amount:.2f} | {bar} {percentage_used:.1%}")
 
@@ -304,14 +626,23 @@ def summarize_expenses(expense_file_path: str, category_budgets: Dict[str, float
 
 # --- UTILITY FUNCTIONS ---
 # Functions for simple ANSI color output
+GREEN, RED, YELLOW, RESET = "\u001B[92m", "\u001B[91m", "\u001B[93m", "\u001B[0m"
+# Colors are only added when printing to a terminal (not when output is piped to a file)
+_USE_COLOR = sys.stdout.isatty()
+
 def green(text):
-    return f"\u001B[92m{text}\u001B[0m"
+    return GREEN + str(text) + RESET if _USE_COLOR else text
 
 def red(text):
-    return f"\u001B[91m{text}\u001B[0m"
+    return RED + str(text) + RESET if _USE_COLOR else text
 
 def yellow(text):
-    return f"\u001B[93m{text}\u001B[0m"
+    return YELLOW + str(text) + RESET if _USE_COLOR else text
+
+# Budget bar chart: every possible bar is built once, BAR_TABLE[n] has n filled blocks
+BAR_LENGTH = 30
+BAR_TABLE = tuple(green('█' * i) + '-' * (BAR_LENGTH - i) for i in range(BAR_LENGTH + 1))
+BAR_OVER = red('█' * BAR_LENGTH) # Shown when a category is over budget
 
 def display_budgeting_tips():
     """Menu option for documentation on the budget philosophy."""
@@ -387,6 +718,18 @@ def get_total_money_and_calculate_budgets() -> Dict[str, float]:
     return category_budgets
 
 
+# Main menu text, printed with a single print() call
+MAIN_MENU = """
+--- Main Menu ---
+1. Add New Expense
+2. View Current Summary
+3. View Specific Month/Year Summary
+4. Delete Expense
+5. Record Savings Use
+6. Budgeting Philosophy (Documentation)
+7. Exit"""
+
+
 def main():
     expense_file_path = "expenses.csv"
     
@@ -403,14 +746,7 @@ def main():
     
     # 2. Main Menu Loop (using a while loop)
     while True:
-        print("\n--- Main Menu ---")
-        print("1. Add New Expense")
-        print("2. View Current Summary")
-        print("3. View Specific Month/Year Summary")
-        print("4. Delete Expense")
-        print("5. Record Savings Use") 
-        print("6. Budgeting Philosophy (Documentation)") 
-        print("7. Exit")
+        print(MAIN_MENU)
         
         choice = input("Enter choice (1-7): ")
 